@@ -15,14 +15,13 @@ _LOGGER: logging.Logger = logging.getLogger(__package__)
 
 async def async_setup(hass: HomeAssistant, config: Config):
     """initialize the integration"""
-    if DOMAIN not in hass.data:
-        hass.data[DOMAIN] = {}
+    hass.data.setdefault(DOMAIN, {})
 
     async def handle_send_message(call):
         coordinator: EufySecurityDataUpdateCoordinator = hass.data[DOMAIN][COORDINATOR]
-        _LOGGER.debug(f"{DOMAIN} - send_message - call.data: {call.data}")
+        _LOGGER.debug("%s - send_message - call.data: %s", DOMAIN, call.data)
         message = call.data.get("message")
-        _LOGGER.debug(f"{DOMAIN} - end_message - message: {message}")
+        _LOGGER.debug("%s - end_message - message: %s", DOMAIN, message)
         await coordinator.send_message(message)
 
     async def handle_force_sync(call):
@@ -42,10 +41,11 @@ async def async_setup(hass: HomeAssistant, config: Config):
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
     """setup config entry"""
-    if hass.data.get(DOMAIN) is None:
-        hass.data.setdefault(DOMAIN, {})
+    domain_data = hass.data.setdefault(DOMAIN, {})
 
-    coordinator = hass.data[DOMAIN][COORDINATOR] = hass.data[DOMAIN].get(COORDINATOR, EufySecurityDataUpdateCoordinator(hass, config_entry))
+    coordinator = domain_data.get(COORDINATOR)
+    if coordinator is None:
+        coordinator = domain_data[COORDINATOR] = EufySecurityDataUpdateCoordinator(hass, config_entry)
 
     await coordinator.initialize()
     for platform in PLATFORMS:
@@ -52,7 +52,7 @@ class EufySecurityProductEntity(BinarySensorEntity, CoordinatorEntity):
     def __init__(self, coordinator: EufySecurityDataUpdateCoordinator, product: Product) -> None:
         super().__init__(coordinator)
         self.product = product
-        self.product.set_state_update_listener(coordinator.async_update_listeners)
+        self.product.set_state_update_listener(coordinator.schedule_update_listeners)
 
         self._attr_unique_id = f"{DOMAIN}_{self.product.product_type.value}_{self.product.serial_no}_debug"
         self._attr_should_poll = False
@@ -25,7 +25,6 @@ from .eufy_security_api.camera import (
     StreamStatus,
 )
 from .eufy_security_api.metadata import Metadata
-from .eufy_security_api.util import wait_for_value_to_equal
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
@@ -73,6 +72,8 @@ class EufySecurityCamera(Camera, EufySecurityEntity):
         # camera image
         self._last_url = None
         self._last_image = None
+        self._picture = None
+        self._picture_image = None
 
         # ffmpeg entities
         self.ffmpeg = self.coordinator.hass.data[DATA_FFMPEG]
@@ -109,7 +110,8 @@ class EufySecurityCamera(Camera, EufySecurityEntity):
         return await super().async_create_stream()
 
     async def _start_hass_streaming(self):
-        await wait_for_value_to_equal(self.product.__dict__, "stream_status", StreamStatus.STREAMING)
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self.product.streaming_event.wait(), STREAM_TIMEOUT_SECONDS)
         await self._stop_hass_streaming()
         await self.async_create_stream()
         if self.stream is not None:
@@ -130,40 +132,45 @@ class EufySecurityCamera(Camera, EufySecurityEntity):
         while True:
             result = await self.stream.async_get_image(width, height)
             if result is not None:
-                _LOGGER.debug(f"_get_image_from_hass_stream - received {len(result)}")
+                _LOGGER.debug("_get_image_from_hass_stream - received %s", len(result))
                 return result
-            _LOGGER.debug(f"_get_image_from_hass_stream - is_empty {result is None}")
+            _LOGGER.debug("_get_image_from_hass_stream - is_empty %s", result is None)
             await asyncio.sleep(STREAM_SLEEP_SECONDS)
 
     async def _get_image_from_stream_url(self, width, height):
         while True:
             result = await ffmpeg.async_get_image(self.hass, await self.stream_source(), width=width, height=height)
             if result is not None:
-                _LOGGER.debug(f"_get_image_from_stream_url - received {len(result)}")
+                _LOGGER.debug("_get_image_from_stream_url - received %s", len(result))
                 return result
-            _LOGGER.debug(f"_get_image_from_stream_url - is_empty {result is None}")
+            _LOGGER.debug("_get_image_from_stream_url - is_empty %s", result is None)
             await asyncio.sleep(STREAM_SLEEP_SECONDS)
 
     async def async_camera_image(self, width: int | None = None, height: int | None = None) -> bytes | None:
-        _LOGGER.debug(f"image 1 - {self.is_streaming} - {self.stream}")
+        _LOGGER.debug("image 1 - %s - %s", self.is_streaming, self.stream)
         if self.is_streaming is True:
             if self.stream is not None:
                 with contextlib.suppress(asyncio.TimeoutError):
                     self._last_image = await asyncio.wait_for(self._get_image_from_stream_url(width, height), STREAM_TIMEOUT_SECONDS)
                     # self._last_image = await asyncio.wait_for(self._get_image_from_hass_stream(width, height), STREAM_TIMEOUT_SECONDS)
-                _LOGGER.debug(f"image 2 with hass stream - is_empty  {self._last_image is None}")
+                _LOGGER.debug("image 2 with hass stream - is_empty  %s", self._last_image is None)
             else:
                 with contextlib.suppress(asyncio.TimeoutError):
                     self._last_image = await asyncio.wait_for(self._get_image_from_stream_url(width, height), STREAM_TIMEOUT_SECONDS)
-                _LOGGER.debug(f"image 2 without hass stream - is_empty {self._last_image is None}")
+                _LOGGER.debug("image 2 without hass stream - is_empty %s", self._last_image is None)
 
         else:
-            if self.product.picture_base64 is not None:
-                self._last_image = bytearray(self.product.picture_base64["data"]["data"])
-
-        _LOGGER.debug(f"async_camera_image 5 - is_empty {self._last_image is None}")
+            picture = self.product.picture_base64
+            if picture is not None:
+                # decode only when property changed event replaced the picture
+                if picture is not self._picture:
+                    self._picture = picture
+                    self._picture_image = bytearray(picture["data"]["data"])
+                self._last_image = self._picture_image
+
+        _LOGGER.debug("async_camera_image 5 - is_empty %s", self._last_image is None)
         if self._last_image is not None:
-            _LOGGER.debug(f"async_camera_image 6 - {len(self._last_image)}")
+            _LOGGER.debug("async_camera_image 6 - %s", len(self._last_image))
         return self._last_image
 
     async def _start_livestream(self) -> None:
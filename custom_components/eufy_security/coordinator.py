@@ -1,10 +1,12 @@
 """Module to initialize coordinator"""
+import asyncio
+from collections.abc import Mapping
 from datetime import timedelta
 import logging
 import json
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady, HomeAssistantError
 from homeassistant.helpers import aiohttp_client
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
@@ -16,10 +18,13 @@ from .eufy_security_api.exceptions import (
     MultiFactorCodeRequiredException,
     WebSocketConnectionException,
 )
+from .eufy_security_api.util import json_loads
 from .model import Config
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+UPDATE_LISTENERS_DELAY = 0.05  # seconds
+
 
 class EufySecurityDataUpdateCoordinator(DataUpdateCoordinator):
     """Data update coordinator for integration"""
@@ -29,6 +34,7 @@ class EufySecurityDataUpdateCoordinator(DataUpdateCoordinator):
         super().__init__(hass, _LOGGER, name=DOMAIN, update_method=self._update_local, update_interval=timedelta(seconds=self.config.sync_interval))
         self._platforms = []
         self.data = {}
+        self._update_listeners_handle: asyncio.TimerHandle = None
         self._api = ApiClient(self.config, aiohttp_client.async_get_clientsession(self.hass), self._on_error)
 
     async def initialize(self):
@@ -53,12 +59,12 @@ class EufySecurityDataUpdateCoordinator(DataUpdateCoordinator):
         return self._platforms
 
     @property
-    def devices(self) -> dict:
+    def devices(self) -> Mapping:
         """get devices from API"""
         return self._api.devices
 
     @property
-    def stations(self) -> dict:
+    def stations(self) -> Mapping:
         """get stations from API"""
         return self._api.stations
 
@@ -70,9 +76,14 @@ class EufySecurityDataUpdateCoordinator(DataUpdateCoordinator):
         """set captcha and connect"""
         await self._api.set_captcha_and_connect(captcha_id, captcha_input)
 
-    async def send_message(self, message: str) -> None:
+    async def send_message(self, message: str | dict) -> None:
         """send message to websocket api"""
-        _LOGGER.debug(f"send_message - {message}")
+        _LOGGER.debug("send_message - %s", message)
+        if isinstance(message, dict) is False:
+            try:
+                message = json_loads(message)
+            except ValueError as exc:
+                raise HomeAssistantError(f"Message is not a valid JSON: {exc}") from exc
         await self._api.send_message(message)
 
     async def set_log_level(self, log_level: str) -> None:
@@ -86,8 +97,20 @@ class EufySecurityDataUpdateCoordinator(DataUpdateCoordinator):
         except WebSocketConnectionException as exc:
             raise UpdateFailed(f"Error communicating with Add-on: {exc}") from exc
 
+    def schedule_update_listeners(self) -> None:
+        """update listeners once for a burst of state changes"""
+        if self._update_listeners_handle is None:
+            self._update_listeners_handle = self.hass.loop.call_later(UPDATE_LISTENERS_DELAY, self._flush_update_listeners)
+
+    def _flush_update_listeners(self) -> None:
+        self._update_listeners_handle = None
+        self.async_update_listeners()
+
     async def disconnect(self):
         """disconnect from api"""
+        if self._update_listeners_handle is not None:
+            self._update_listeners_handle.cancel()
+            self._update_listeners_handle = None
         await self._api.disconnect()
 
     def _on_error(self, error):
@@ -18,7 +18,7 @@ class EufySecurityEntity(CoordinatorEntity):
     def __init__(self, coordinator: EufySecurityDataUpdateCoordinator, metadata: Metadata) -> None:
         super().__init__(coordinator)
         self.metadata: Metadata = metadata
-        self.product.set_state_update_listener(coordinator.async_update_listeners)
+        self.product.set_state_update_listener(coordinator.schedule_update_listeners)
         # self.product.set_state_update_listener(self.async_write_ha_state)
         # platform = entity_platform.async_get_current_platform().domain
         self._attr_unique_id = f"{DOMAIN}_{self.product.serial_no}_{self.product.product_type.value}_{metadata.name}"
@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Mapping
 from enum import Enum
-import json
 import logging
+from types import MappingProxyType
 from typing import Any
 
 import aiohttp
@@ -35,8 +36,14 @@ from .exceptions import (
 )
 from .outgoing_message import OutgoingMessage, OutgoingMessageType
 from .product import Device, Product, Station
+from .util import json_dumps
 from .web_socket_client import WebSocketClient
 
+PRODUCT_EVENT_SOURCE_TO_ATTRIBUTE = {EventSourceType.station.name: "_stations", EventSourceType.device.name: "_devices"}
+DRIVER_EVENT_SOURCES = frozenset({EventSourceType.driver.name, EventSourceType.server.name})
+
+RESULT_TIMEOUT_SECONDS = 30
+
 
 class ApiClient:
     """Client to communicate with eufy-security-ws over websocket connection"""
@@ -46,19 +53,24 @@ class ApiClient:
         self._client: WebSocketClient = WebSocketClient(self._config.host, self._config.port, session, self._on_open, self._on_message, self._on_close, self._on_error)
         self._on_error_callback = on_error_callback
         self._result_futures: dict[str, asyncio.Future] = {}
-        self._devices: dict = None
-        self._stations: dict = None
+        self._message_handlers = {
+            IncomingMessageType.result.name: self._on_result_message,
+            IncomingMessageType.event.name: self._on_event_message,
+            IncomingMessageType.version.name: self._on_version_message,
+        }
+        self._devices: Mapping = None
+        self._stations: Mapping = None
         self._captcha_future: asyncio.Future[dict] = asyncio.get_event_loop().create_future()
         self._mfa_future: asyncio.Future[dict] = asyncio.get_event_loop().create_future()
 
     @property
-    def devices(self) -> dict:
-        """initialized devices"""
+    def devices(self) -> Mapping:
+        """initialized devices, read only"""
         return self._devices
 
     @property
-    def stations(self) -> dict:
-        """initialized stations"""
+    def stations(self) -> Mapping:
+        """initialized stations, read only"""
         return self._stations
 
     async def ws_connect(self):
@@ -74,58 +86,63 @@ class ApiClient:
     async def _check_interactive_mode(self):
         # driver is not connected, wait for captcha event
         try:
-            _LOGGER.debug(f"_check_interactive_mode 1")
+            _LOGGER.debug("_check_interactive_mode 1")
             await asyncio.wait_for(self._captcha_future, timeout=10)
             event = self._captcha_future.result()
             raise CaptchaRequiredException(event.data[MessageField.CAPTCHA_ID.value], event.data[MessageField.CAPTCHA_IMG.value])
         except (asyncio.exceptions.TimeoutError, asyncio.exceptions.CancelledError):
             pass
-        _LOGGER.debug(f"_check_interactive_mode 2")
+        _LOGGER.debug("_check_interactive_mode 2")
         # driver is not connected and captcha exception is not thrown, wait for mfa event
         try:
-            _LOGGER.debug(f"_check_interactive_mode 3")
+            _LOGGER.debug("_check_interactive_mode 3")
             await asyncio.wait_for(self._mfa_future, timeout=5)
             event = self._mfa_future.result()
             raise MultiFactorCodeRequiredException()
         except (asyncio.exceptions.TimeoutError, asyncio.exceptions.CancelledError) as exc:
-            _LOGGER.debug(f"_check_interactive_mode 4")
+            _LOGGER.debug("_check_interactive_mode 4")
             await self._connect_driver()
             raise DriverNotConnectedException() from exc
 
     async def _set_products(self) -> None:
-        _LOGGER.debug(f"_set_products 1")
+        _LOGGER.debug("_set_products 1")
         self._captcha_future = asyncio.get_event_loop().create_future()
         self._mfa_future = asyncio.get_event_loop().create_future()
         result = await self._start_listening()
-        _LOGGER.debug(f"_set_products 2")
+        _LOGGER.debug("_set_products 2")
 
         if result[MessageField.STATE.value][EventSourceType.driver.name][MessageField.CONNECTED.value] is False:
             await self._check_interactive_mode()
 
-        self._devices = await self._get_products(ProductType.device, result[MessageField.STATE.value]["devices"])
-        self._stations = await self._get_products(ProductType.station, result[MessageField.STATE.value]["stations"])
+        devices, stations = await asyncio.gather(
+            self._get_products(ProductType.device, result[MessageField.STATE.value]["devices"]),
+            self._get_products(ProductType.station, result[MessageField.STATE.value]["stations"]),
+        )
+        # publish new read only views at once, readers never see a partially built mapping
+        self._devices = MappingProxyType(devices)
+        self._stations = MappingProxyType(stations)
 
     async def _get_products(self, product_type: ProductType, products: list) -> dict:
-        response = {}
-        for serial_no in products:
-            product: Product = None
-            properties = await self._get_properties(product_type, serial_no)
-            metadata = await self._get_metadata(product_type, serial_no)
-            commands = await self._get_commands(product_type, serial_no)
-
-            if product_type == ProductType.device:
-                if ProductCommand.start_livestream.name in commands:
-                    is_rtsp_streaming = await self._get_is_rtsp_streaming(product_type, serial_no)
-                    is_p2p_streaming = await self._get_is_p2p_streaming(product_type, serial_no)
-                    voices = await self._get_voices(product_type, serial_no)
-                    product = Camera(self, serial_no, properties, metadata, commands, self._config, is_rtsp_streaming, is_p2p_streaming, voices)
-                else:
-                    product = Device(self, serial_no, properties, metadata, commands)
-            else:
-                product = Station(self, serial_no, properties, metadata, commands)
-
-            response[serial_no] = product
-        return response
+        result = await asyncio.gather(*[self._get_product(product_type, serial_no) for serial_no in products])
+        return {product.serial_no: product for product in result}
+
+    async def _get_product(self, product_type: ProductType, serial_no: str) -> Product:
+        properties, metadata, commands = await asyncio.gather(
+            self._get_properties(product_type, serial_no),
+            self._get_metadata(product_type, serial_no),
+            self._get_commands(product_type, serial_no),
+        )
+
+        if product_type == ProductType.device:
+            if ProductCommand.start_livestream.name in commands:
+                is_rtsp_streaming, is_p2p_streaming, voices = await asyncio.gather(
+                    self._get_is_rtsp_streaming(product_type, serial_no),
+                    self._get_is_p2p_streaming(product_type, serial_no),
+                    self._get_voices(product_type, serial_no),
+                )
+                return Camera(self, serial_no, properties, metadata, commands, self._config, is_rtsp_streaming, is_p2p_streaming, voices)
+            return Device(self, serial_no, properties, metadata, commands)
+        return Station(self, serial_no, properties, metadata, commands)
 
     async def set_captcha_and_connect(self, captcha_id: str, captcha_input: str):
         """Set captcha set products"""
@@ -252,40 +269,46 @@ class ApiClient:
         await self._send_message_get_response(OutgoingMessage(OutgoingMessageType.reboot, serial_no=serial_no))
 
     async def _on_message(self, message: dict) -> None:
-        message_str = str(message)[0:200]
-        message_str = str(message)
-        if "livestream video data" not in message_str and "livestream audio data" not in message_str:
-            _LOGGER.debug(f"_on_message - {message_str}")
-        if message[MessageField.TYPE.value] == IncomingMessageType.result.name:
-            future = self._result_futures.get(message.get(MessageField.MESSAGE_ID.value, -1), None)
-
-            if future is None:
-                return
-
-            if message[MessageField.SUCCESS.value]:
-                future.set_result(message[IncomingMessageType.result.name])
-                return
-
-            future.set_exception(FailedCommandException(message[MessageField.MESSAGE_ID.value], message[MessageField.ERROR_CODE.value], message))
-        elif message[MessageField.TYPE.value] == IncomingMessageType.event.name:
-            event: Event = Event(type=message[IncomingMessageType.event.name][IncomingMessageType.event.name], data=message[IncomingMessageType.event.name])
-            await self._handle_event(event)
-        elif message[MessageField.TYPE.value] == IncomingMessageType.version.name:
-            if SCHEMA_VERSION > message["maxSchemaVersion"]:
-                raise IncompatibleVersionException(message["maxSchemaVersion"], SCHEMA_VERSION)
-        else:
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            message_str = str(message)
+            if "livestream video data" not in message_str and "livestream audio data" not in message_str:
+                _LOGGER.debug("_on_message - %s", message_str)
+        handler = self._message_handlers.get(message[MessageField.TYPE.value])
+        if handler is None:
             raise UnexpectedMessageTypeException(message)
+        await handler(message)
+
+    async def _on_result_message(self, message: dict) -> None:
+        future = self._result_futures.get(message.get(MessageField.MESSAGE_ID.value, -1), None)
+
+        if future is None:
+            return
+
+        if message[MessageField.SUCCESS.value]:
+            future.set_result(message[IncomingMessageType.result.name])
+            return
+
+        future.set_exception(FailedCommandException(message[MessageField.MESSAGE_ID.value], message[MessageField.ERROR_CODE.value], message))
+
+    async def _on_event_message(self, message: dict) -> None:
+        event: Event = Event(type=message[IncomingMessageType.event.name][IncomingMessageType.event.name], data=message[IncomingMessageType.event.name])
+        await self._handle_event(event)
+
+    async def _on_version_message(self, message: dict) -> None:
+        if SCHEMA_VERSION > message["maxSchemaVersion"]:
+            raise IncompatibleVersionException(message["maxSchemaVersion"], SCHEMA_VERSION)
 
     async def _handle_event(self, event: Event):
-        if event.data[MessageField.SOURCE.value] in [EventSourceType.station.name, EventSourceType.device.name]:
+        source = event.data[MessageField.SOURCE.value]
+        products_attribute = PRODUCT_EVENT_SOURCE_TO_ATTRIBUTE.get(source)
+        if products_attribute is not None:
             # handle device or statino specific events through specific instances
-            plural_product = "_" + event.data[MessageField.SOURCE.value] + "s"
             try:
-                product = self.__dict__[plural_product][event.data[MessageField.SERIAL_NO.value]]
+                product = getattr(self, products_attribute)[event.data[MessageField.SERIAL_NO.value]]
                 await product.process_event(event)
             except (KeyError, TypeError) as exc:
                 raise DeviceNotInitializedYetException(event) from exc
-        elif event.data[MessageField.SOURCE.value] in [EventSourceType.driver.name, EventSourceType.server.name]:
+        elif source in DRIVER_EVENT_SOURCES:
             # handle driver or server specific events locally
             await self._process_driver_event(event)
         else:
@@ -302,29 +325,31 @@ class ApiClient:
         _LOGGER.debug("on_open - executed")
 
     def _on_close(self, future="") -> None:
-        _LOGGER.debug(f"on_close - executed - {future} = {future.exception()}")
+        _LOGGER.debug("on_close - executed - %s = %s", future, future.exception())
         self._on_error_callback(future)
         if future.exception() is not None:
-            _LOGGER.debug(f"on_close - executed - {future.exception()}")
+            _LOGGER.debug("on_close - executed - %s", future.exception())
             raise future.exception()
 
     async def _on_error(self, error: str) -> None:
-        _LOGGER.error(f"on_error - {error}")
+        _LOGGER.error("on_error - %s", error)
         raise WebSocketConnectionException(error)
 
     async def _send_message_get_response(self, message: OutgoingMessage) -> dict:
-        future: "asyncio.Future[dict]" = asyncio.get_event_loop().create_future()
+        future: "asyncio.Future[dict]" = asyncio.get_running_loop().create_future()
         self._result_futures[message.id] = future
-        await self.send_message(message.content)
         try:
-            return await future
+            await self.send_message(message.content)
+            return await asyncio.wait_for(future, RESULT_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError as exc:
+            raise WebSocketConnectionException(f"No response from add-on for {message.command} in {RESULT_TIMEOUT_SECONDS} seconds") from exc
         finally:
             self._result_futures.pop(message.id)
 
     async def send_message(self, message: dict) -> None:
         """send message to websocket api"""
-        _LOGGER.debug(f"send_message - {message}")
-        await self._client.send_message(json.dumps(message))
+        _LOGGER.debug("send_message - %s", message)
+        await self._client.send_message(json_dumps(message))
 
     async def disconnect(self):
         """Disconnect the web socket and destroy it"""
@@ -12,7 +12,6 @@ from .event import Event
 from .exceptions import CameraRTSPStreamNotEnabled, CameraRTSPStreamNotSupported
 from .p2p_stream_handler import P2PStreamHandler
 from .product import Device
-from .util import wait_for_value
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
@@ -51,6 +50,7 @@ class Camera(Device):
     def __init__(self, api, serial_no: str, properties: dict, metadata: dict, commands: [], config, is_rtsp_streaming: bool, is_p2p_streaming: bool, voices: dict) -> None:
         super().__init__(api, serial_no, properties, metadata, commands)
 
+        self.streaming_event = asyncio.Event()
         self.stream_status: StreamStatus = StreamStatus.IDLE
         self.stream_provider: StreamProvider = None
         self.stream_url: str = None
@@ -71,6 +71,18 @@ class Camera(Device):
         self.p2p_started_event = asyncio.Event()
         self.rtsp_started_event = asyncio.Event()
 
+    def _set_stream_status(self, stream_status: StreamStatus) -> None:
+        if self.stream_status == stream_status:
+            return
+        self.stream_status = stream_status
+        if stream_status == StreamStatus.STREAMING:
+            self.streaming_event.set()
+        else:
+            self.streaming_event.clear()
+
+        if self.state_update_listener is not None:
+            self.state_update_listener()
+
     @property
     def is_streaming(self) -> bool:
         """Is Camera in Streaming Status"""
@@ -83,26 +95,31 @@ class Camera(Device):
 
     async def _handle_livestream_started(self, event: Event):
         # automatically find this function for respective event
-        _LOGGER.debug(f"_handle_livestream_started - {event}")
+        _LOGGER.debug("_handle_livestream_started - %s", event)
+        return False
 
     async def _handle_livestream_stopped(self, event: Event):
         # automatically find this function for respective event
-        _LOGGER.debug(f"_handle_livestream_stopped - {event}")
-        self.stream_status = StreamStatus.IDLE
+        _LOGGER.debug("_handle_livestream_stopped - %s", event)
+        self._set_stream_status(StreamStatus.IDLE)
         self.video_queue.queue.clear()
+        return False
 
     async def _handle_rtsp_livestream_started(self, event: Event):
         # automatically find this function for respective event
-        _LOGGER.debug(f"_handle_rtsp_livestream_started - {event}")
+        _LOGGER.debug("_handle_rtsp_livestream_started - %s", event)
         self.rtsp_started_event.set()
+        return False
 
     async def _handle_rtsp_livestream_stopped(self, event: Event):
         # automatically find this function for respective event
-        _LOGGER.debug(f"_handle_rtsp_livestream_stopped - {event}")
-        self.stream_status = StreamStatus.IDLE
+        _LOGGER.debug("_handle_rtsp_livestream_stopped - %s", event)
+        self._set_stream_status(StreamStatus.IDLE)
+        return False
 
     async def _handle_livestream_video_data_received(self, event: Event):
         # automatically find this function for respective event
+        # notify on every frame, queue size changes and coordinator coalesces listener updates
         if self.codec is None:
             self.codec = event.data["metadata"]["videoCodec"].lower()
             await self._start_ffmpeg()
@@ -119,7 +136,7 @@ class Camera(Device):
                 async with RTSPReader(self.stream_url.replace("rtsp://", "rtspt://")) as reader:
                     _LOGGER.debug("_is_stream_url_ready - 2 - reader opened")
                     async for pkt in reader.iter_packets():
-                        _LOGGER.debug(f"_is_stream_url_ready - 3 - received {len(pkt)}")
+                        _LOGGER.debug("_is_stream_url_ready - 3 - received %s", len(pkt))
                         return True
                     _LOGGER.debug("_is_stream_url_ready - 4 - reader closed")
                 await asyncio.sleep(STREAM_SLEEP_SECONDS)
@@ -128,11 +145,14 @@ class Camera(Device):
     async def start_livestream(self) -> bool:
         """Process start p2p livestream call"""
         self.set_stream_prodiver(StreamProvider.P2P)
-        self.stream_status = StreamStatus.PREPARING
+        self._set_stream_status(StreamStatus.PREPARING)
+        self.p2p_started_event.clear()
+        self.p2p_stream_handler.port_event.clear()
         await self.api.start_livestream(self.product_type, self.serial_no)
-        self.p2p_stream_thread = threading.Thread(target=self.p2p_stream_handler.setup, daemon=True)
+        self.p2p_stream_thread = threading.Thread(target=self.p2p_stream_handler.setup, args=(asyncio.get_running_loop(),), daemon=True)
         self.p2p_stream_thread.start()
-        await wait_for_value(self.p2p_stream_handler.__dict__, "port", None)
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self.p2p_stream_handler.port_event.wait(), STREAM_TIMEOUT_SECONDS)
 
         if self.codec is not None:
             await self._start_ffmpeg()
@@ -147,7 +167,7 @@ class Camera(Device):
             await asyncio.wait_for(self._is_stream_url_ready(), STREAM_TIMEOUT_SECONDS)
         except asyncio.TimeoutError:
             return False
-        self.stream_status = StreamStatus.STREAMING
+        self._set_stream_status(StreamStatus.STREAMING)
         return True
 
     async def stop_livestream(self):
@@ -159,7 +179,8 @@ class Camera(Device):
     async def start_rtsp_livestream(self):
         """Process start rtsp livestream call"""
         self.set_stream_prodiver(StreamProvider.RTSP)
-        self.stream_status = StreamStatus.PREPARING
+        self._set_stream_status(StreamStatus.PREPARING)
+        self.rtsp_started_event.clear()
         await self.api.start_rtsp_livestream(self.product_type, self.serial_no)
         with contextlib.suppress(asyncio.TimeoutError):
             await asyncio.wait_for(self.rtsp_started_event.wait(), 5)
@@ -171,7 +192,7 @@ class Camera(Device):
             await asyncio.wait_for(self._is_stream_url_ready(), 5)
         except asyncio.TimeoutError:
             return False
-        self.stream_status = StreamStatus.STREAMING
+        self._set_stream_status(StreamStatus.STREAMING)
         return True
 
     async def stop_rtsp_livestream(self):
@@ -239,9 +260,9 @@ class Camera(Device):
                 raise CameraRTSPStreamNotEnabled(self.name)
         elif self.stream_provider == StreamProvider.P2P:
             url = self.stream_provider.value
-            _LOGGER.debug(f"{self.p2p_stream_handler.port}")
+            _LOGGER.debug("%s", self.p2p_stream_handler.port)
             url = url.replace("{serial_no}", str(self.serial_no))
             url = url.replace("{server_address}", str(self.config.rtsp_server_address))
             url = url.replace("{server_port}", str(self.config.rtsp_server_port))
             self.stream_url = url
-        _LOGGER.debug(f"url - {self.stream_provider} - {self.stream_url}")
+        _LOGGER.debug("url - %s - %s", self.stream_provider, self.stream_url)
@@ -89,6 +89,35 @@ class OutgoingMessageType(Enum):
     reboot = {MessageField.DUMMY: auto(), MessageField.DOMAIN: EventSourceType.station}
 
 
+PRODUCT_DOMAINS = frozenset({EventSourceType.product, EventSourceType.station, EventSourceType.device})
+
+# message fields paired with their runtime parameters, resolved once per message type
+MESSAGE_TYPE_TO_PARAMETERS = {
+    message_type: tuple(
+        (key.value, OutgoingMessageToParameter[key.value].value)
+        for key in message_type.value.keys()
+        if key.value in OutgoingMessageToParameter.__members__
+    )
+    for message_type in OutgoingMessageType
+}
+
+
+def _get_command(message_type: OutgoingMessageType, domain: str) -> str:
+    return message_type.name if domain == EventSourceType.server.value else domain + "." + message_type.name
+
+
+# commands resolved once per message type and domain, product messages are sent to either station or device domain
+MESSAGE_TYPE_AND_DOMAIN_TO_COMMAND = {
+    (message_type, domain): _get_command(message_type, domain)
+    for message_type in OutgoingMessageType
+    for domain in (
+        [EventSourceType.station.value, EventSourceType.device.value]
+        if message_type.value[MessageField.DOMAIN] == EventSourceType.product
+        else [message_type.value[MessageField.DOMAIN].value]
+    )
+}
+
+
 class OutgoingMessage:
     """Outgoing message"""
 
@@ -96,22 +125,21 @@ class OutgoingMessage:
         self._type = message_type
         self._message = {}
 
-        for key in message_type.value.keys():
-            try:
-                self._message[key.value] = kwargs.get(OutgoingMessageToParameter[key.value].value)
-            except KeyError:
-                pass
+        for field, parameter in MESSAGE_TYPE_TO_PARAMETERS[message_type]:
+            self._message[field] = kwargs.get(parameter)
 
         default_domain = message_type.value[MessageField.DOMAIN]
-        if default_domain in [EventSourceType.product, EventSourceType.station, EventSourceType.device]:
+        if default_domain in PRODUCT_DOMAINS:
             self._message[MessageField.SERIAL_NO.value] = kwargs.get(OutgoingMessageToParameter[MessageField.SERIAL_NO.value].value)
 
         domain = default_domain.value if default_domain != EventSourceType.product else kwargs.get(MessageField.DOMAIN.value, "")
-        command = self.type.name if domain == EventSourceType.server.value else domain + "." + self.type.name
-        _LOGGER.debug(f"domain - {domain} - {default_domain} - {command} - {kwargs} - {self._message}")
+        command = MESSAGE_TYPE_AND_DOMAIN_TO_COMMAND.get((message_type, domain))
+        if command is None:
+            command = _get_command(message_type, domain)
+        _LOGGER.debug("domain - %s - %s - %s - %s - %s", domain, default_domain, command, kwargs, self._message)
         self._message[MessageField.COMMAND.value] = command
         self._message[MessageField.MESSAGE_ID.value] = self.command + "." + uuid.uuid4().hex
-        _LOGGER.debug(self._message)
+        _LOGGER.debug("%s", self._message)
 
     @property
     def id(self) -> str:
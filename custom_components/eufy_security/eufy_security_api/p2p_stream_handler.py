@@ -42,6 +42,7 @@ class P2PStreamHandler:
         self.camera = camera
 
         self.port = None
+        self.port_event = asyncio.Event()
         self.loop = None
         self.ffmpeg = None
 
@@ -70,31 +71,33 @@ class P2PStreamHandler:
             stderr_pipe=False,
             stdout_pipe=False,
         )
-        _LOGGER.debug(f"start_ffmpeg - stream_url {stream_url} command {command} options {options}")
+        _LOGGER.debug("start_ffmpeg - stream_url %s command %s options %s", stream_url, command, options)
 
     @property
     def ffmpeg_available(self) -> bool:
         """True if ffmpeg exists and running"""
         return self.ffmpeg is not None and self.ffmpeg.is_running is True
 
-    def setup(self):
+    def setup(self, loop: asyncio.AbstractEventLoop):
         """Setup the handler"""
+        self.loop = loop
         self.port = None
         empty_queue_counter = 0
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
             sock.bind(("localhost", 0))
             self.port = sock.getsockname()[1]
+            self.loop.call_soon_threadsafe(self.port_event.set)
             # self._set_remote_config()
             _LOGGER.debug("p2p 1 - waiting")
             sock.listen()
             client_socket, _ = sock.accept()
             _LOGGER.debug("p2p 1 - arrived")
-            self.camera.p2p_started_event.set()
+            self.loop.call_soon_threadsafe(self.camera.p2p_started_event.set)
             client_socket.setblocking(False)
             try:
                 with client_socket:
                     while empty_queue_counter < 10 and self.ffmpeg_available:
-                        _LOGGER.debug(f"p2p 5 - q size: {self.camera.video_queue.qsize()} - empty {empty_queue_counter}")
+                        _LOGGER.debug("p2p 5 - q size: %s - empty %s", self.camera.video_queue.qsize(), empty_queue_counter)
                         if self.camera.video_queue.empty():
                             empty_queue_counter = empty_queue_counter + 1
                         else:
@@ -104,9 +107,10 @@ class P2PStreamHandler:
                         sleep(500 / 1000)
                 _LOGGER.debug("p2p 6")
             except Exception as ex:  # pylint: disable=broad-except
-                _LOGGER.error(f"Exception %s - traceback: %s", ex, traceback.format_exc())
+                _LOGGER.error("Exception %s - traceback: %s", ex, traceback.format_exc())
         asyncio.run_coroutine_threadsafe(self.stop(), self.loop).result()
         self.port = None
+        self.loop.call_soon_threadsafe(self.port_event.clear)
         _LOGGER.debug("p2p 7")
 
     async def stop(self):
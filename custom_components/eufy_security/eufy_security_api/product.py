@@ -27,6 +27,7 @@ class Product:
         self.metadata: dict = None
         self.metadata_org = metadata
         self.commands = commands
+        self._command_set = frozenset(commands)
 
         self.state_update_listener: Callable = None
 
@@ -37,7 +38,7 @@ class Product:
 
     def _set_properties(self, properties: dict) -> None:
         self.properties = properties
-        _LOGGER.debug(f"_set_properties -{self.serial_no} - {properties}")
+        _LOGGER.debug("_set_properties -%s - %s", self.serial_no, properties)
         self.name = properties.get(MessageField.NAME.value, "UNSUPPORTED")
         self.model = properties.get(MessageField.MODEL.value, "UNSUPPORTED")
         self.hardware_version = properties.get(MessageField.HARDWARE_VERSION.value, "UNSUPPORTED")
@@ -87,7 +88,7 @@ class Product:
         return True
 
     async def process_event(self, event: Event):
-        """Act on received event"""
+        """Act on received event, handlers return False when state is unchanged"""
         handler_func = None
 
         try:
@@ -97,28 +98,37 @@ class Product:
             # event is not acted on, skip it
             return
 
-        if handler_func is not None:
-            await handler_func(event)
+        if handler_func is None:
+            # no handler, state is unchanged
+            return
+
+        if await handler_func(event) is False:
+            return
 
         if self.state_update_listener is not None:
             callback_func = self.state_update_listener
             callback_func()
 
     async def _handle_property_changed(self, event: Event):
-        self.properties[event.data[MessageField.NAME.value]] = event.data[MessageField.VALUE.value]
+        name = event.data[MessageField.NAME.value]
+        value = event.data[MessageField.VALUE.value]
+        if name in self.properties and self.properties[name] == value:
+            return False
+        self.properties[name] = value
 
     async def _handle_pin_verified(self, event: Event):
         self.pin_verified_future.set_result(event)
+        return False
 
     @property
     def is_camera(self):
         """checks if Product is camera"""
-        return True if ProductCommand.start_livestream.value.command in self.commands else False
+        return True if ProductCommand.start_livestream.value.command in self._command_set else False
 
     @property
     def is_safe_lock(self):
         """checks if Product is safe lock"""
-        return True if ProductCommand.verify_pin.value.command in self.commands else False
+        return True if ProductCommand.verify_pin.value.command in self._command_set else False
 
     def has(self, property_name: str) -> bool:
         """Checks if product has required property"""
@@ -7,6 +7,7 @@ import traceback
 import aiohttp
 
 from .exceptions import WebSocketConnectionException
+from .util import json_loads
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
@@ -66,7 +67,7 @@ class WebSocketClient:
     async def _on_message(self, message):
         try:
             if self.message_callback is not None:
-                await self.message_callback(message.json())
+                await self.message_callback(json_loads(message.data))
         except:
             traceback.print_exc()
 
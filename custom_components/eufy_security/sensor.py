@@ -65,6 +65,10 @@ class EufySecuritySensor(SensorEntity, EufySecurityEntity):
             except KeyError:
                 # _LOGGER.info(f"Exception handled - {ValueNotSetException(self.metadata)}")
                 pass
-        if len(str(value)) > 250:
-            value = str(value)[-250:]
+        if value is None or isinstance(value, (int, float)):
+            # numbers are short enough, skip string conversion
+            return value
+        text = value if isinstance(value, str) else str(value)
+        if len(text) > 250:
+            return text[-250:]
         return value